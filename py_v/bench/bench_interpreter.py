@@ -0,0 +1,96 @@
+"""
+Measure ThreeAddressInterpreter throughput in executed instructions per second.
+
+Run from the repository root:
+
+    python py_v/bench/bench_interpreter.py --iterations 20000
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compiler.lexer import tokenize
+from compiler.parser import Parser
+from compiler.interpreter import ThreeAddressInterpreter
+from utils import trace
+
+LOOP_PROGRAM = """
+let i = 0;
+let total = 0;
+while (i < {iterations}) {{
+    if (i % 3 == 0) {{
+        total = total + i * 2;
+    }} else {{
+        total = total - 1;
+    }}
+    if (i == {iterations} + 1) {{
+        break;
+    }}
+    i = i + 1;
+}}
+print(total);
+"""
+
+
+def compile_tac(source):
+    parser = Parser(tokenize(source))
+    parser.parse()
+    return list(parser.codegen.code)
+
+
+def count_instructions(tac_code):
+    """Count executed instructions once by listening to the step trace."""
+    steps = 0
+
+    def counter(msg):
+        nonlocal steps
+        if "[IP=" in msg:
+            steps += 1
+
+    previous_level, previous_sinks = trace.level, list(trace.sinks)
+    trace.set_level(trace.STEPS)
+    trace.set_sinks(counter)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ThreeAddressInterpreter(tac_code).run()
+    finally:
+        trace.set_level(previous_level)
+        trace.set_sinks(*previous_sinks)
+    return steps
+
+
+def time_run(tac_code, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        interpreter = ThreeAddressInterpreter(tac_code)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            interpreter.run()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--iterations", type=int, default=20000, help="loop iterations of the benchmark program")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="runs to take the best time from")
+    args = arg_parser.parse_args()
+
+    trace.set_level(trace.OFF)
+    tac_code = compile_tac(LOOP_PROGRAM.format(iterations=args.iterations))
+    executed = count_instructions(tac_code)
+    elapsed = time_run(tac_code, args.repeat)
+
+    print(f"program:      {len(tac_code)} TAC instructions, {args.iterations} loop iterations")
+    print(f"executed:     {executed} instructions")
+    print(f"best time:    {elapsed * 1000:.2f} ms (of {args.repeat} runs)")
+    print(f"throughput:   {executed / elapsed:,.0f} instructions/sec")
+
+
+if __name__ == "__main__":
+    main()
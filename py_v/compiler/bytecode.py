@@ -0,0 +1,180 @@
+"""
+Binary bytecode (.dlmc) for compiled Dolme programs.
+
+Layout (little endian):
+
+    header      magic "DLMC", version, flags, section counts and offsets
+    registers   TAC address of every register slot (length-prefixed UTF-8)
+    constants   tagged constant pool entries
+    symbols     variable name -> register slot
+    code        fixed-width 16 byte records: opcode u8, 3 pad bytes, arg1 i32, arg2 i32, result i32
+
+Operands use the same flat memory indexes as `Program.code` and -1 stands for
+"no operand". `load` maps the file with mmap and reads it in place, without
+first copying it into a bytes object, but the decode itself is eager: the
+interpreter dispatches on Python tuples, so the registers, constants, symbols
+and every instruction record become Python lists and tuples up front. That
+costs time proportional to the program, with no lexing or parsing.
+"""
+import mmap
+import struct
+from compiler.program import Program
+from utils.show_msg import show_error
+
+MAGIC = b"DLMC"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHIIIIIIII")
+RECORD = struct.Struct("<B3xiii")
+U32 = struct.Struct("<I")
+I64 = struct.Struct("<q")
+F64 = struct.Struct("<d")
+
+TAG_INT, TAG_FLOAT, TAG_STR, TAG_BIGINT = range(4)
+NONE_INDEX = -1
+
+
+def pack_str(out, text):
+    data = text.encode("utf-8")
+    out += U32.pack(len(data))
+    out += data
+
+
+def unpack_str(buffer, offset):
+    (size,) = U32.unpack_from(buffer, offset)
+    offset += U32.size
+    return str(buffer[offset:offset + size], "utf-8"), offset + size
+
+
+def pack_constant(out, value):
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, int):
+        if -2**63 <= value < 2**63:
+            out.append(TAG_INT)
+            out += I64.pack(value)
+        else:
+            out.append(TAG_BIGINT)
+            pack_str(out, str(value))
+    elif isinstance(value, float):
+        out.append(TAG_FLOAT)
+        out += F64.pack(value)
+    else:
+        out.append(TAG_STR)
+        pack_str(out, str(value))
+
+
+def unpack_constant(buffer, offset):
+    tag = buffer[offset]
+    offset += 1
+    if tag == TAG_INT:
+        return I64.unpack_from(buffer, offset)[0], offset + I64.size
+    if tag == TAG_FLOAT:
+        return F64.unpack_from(buffer, offset)[0], offset + F64.size
+    text, offset = unpack_str(buffer, offset)
+    return (int(text) if tag == TAG_BIGINT else text), offset
+
+
+def encode_index(index):
+    return NONE_INDEX if index is None else index
+
+
+def decode_index(index):
+    return None if index == NONE_INDEX else index
+
+
+def dumps(program):
+    registers = bytearray()
+    for address in program.addresses:
+        pack_str(registers, address)
+
+    constants = bytearray()
+    for value in program.constants:
+        pack_constant(constants, value)
+
+    symbols = bytearray()
+    for name, address in program.symbol_table.items():
+        pack_str(symbols, name)
+        symbols += U32.pack(program.registers[address])
+
+    code = bytearray()
+    for opcode, arg1, arg2, result in program.code:
+        code += RECORD.pack(opcode, encode_index(arg1), encode_index(arg2), encode_index(result))
+
+    registers_offset = HEADER.size
+    constants_offset = registers_offset + len(registers)
+    symbols_offset = constants_offset + len(constants)
+    padding = -(symbols_offset + len(symbols)) % 4
+    code_offset = symbols_offset + len(symbols) + padding
+
+    header = HEADER.pack(
+        MAGIC, VERSION, 0,
+        len(program.code), len(program.addresses), len(program.constants), len(program.symbol_table),
+        registers_offset, constants_offset, symbols_offset, code_offset,
+    )
+    return b"".join((header, registers, constants, symbols, bytes(padding), code))
+
+
+def dump(program, filename):
+    with open(filename, "wb") as f:
+        f.write(dumps(program))
+
+
+def loads(buffer):
+    """
+    Decode a `Program` from any buffer (bytes, bytearray, mmap). The buffer is
+    read through a memoryview rather than copied; the decoded tables are new lists.
+    """
+    view = memoryview(buffer)
+    try:
+        if len(view) < HEADER.size:
+            show_error("runtime", "interpreter", "Bytecode is truncated")
+        (magic, version, flags, n_code, n_registers, n_constants, n_symbols,
+         registers_offset, constants_offset, symbols_offset, code_offset) = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            show_error("runtime", "interpreter", "Not a Dolme bytecode file")
+        if version != VERSION:
+            show_error("runtime", "interpreter", f"Unsupported bytecode version {version}, expected {VERSION}")
+
+        offset = registers_offset
+        addresses = []
+        for _ in range(n_registers):
+            address, offset = unpack_str(view, offset)
+            addresses.append(address)
+
+        offset = constants_offset
+        constants = []
+        for _ in range(n_constants):
+            value, offset = unpack_constant(view, offset)
+            constants.append(value)
+
+        offset = symbols_offset
+        symbol_table = {}
+        for _ in range(n_symbols):
+            name, offset = unpack_str(view, offset)
+            (slot,) = U32.unpack_from(view, offset)
+            offset += U32.size
+            symbol_table[name] = addresses[slot]
+
+        code_end = code_offset + n_code * RECORD.size
+        if code_end > len(view):
+            show_error("runtime", "interpreter", "Bytecode is truncated")
+        code = [
+            (opcode, decode_index(arg1), decode_index(arg2), decode_index(result))
+            for opcode, arg1, arg2, result in RECORD.iter_unpack(view[code_offset:code_end])
+        ]
+    finally:
+        view.release()
+
+    return Program(code, constants, addresses, symbol_table)
+
+
+def load(filename):
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return loads(mapped)
+
+
+def is_bytecode(filename):
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
@@ -1,3 +1,7 @@
+def format_instruction(instruction):
+    return "({}, {}, {}, {})".format(*instruction)
+
+
 class CodeGenerator:
     def __init__(self):
         self.code = []
@@ -23,11 +27,16 @@ class CodeGenerator:
         return self.var_table.get(var_name, None)
 
     def emit(self, op, arg1='_', arg2='_', result='_'):
-        line = f"({op}, {arg1}, {arg2}, {result})"
-        self.code.append(line)
+        self.code.append((str(op), str(arg1), str(arg2), str(result)))
         self.current_line += 1
+
+    def patch(self, index, op, arg1='_', arg2='_', result='_'):
+        self.code[index] = (str(op), str(arg1), str(arg2), str(result))
+
+    def lines(self):
+        return [format_instruction(instruction) for instruction in self.code]
     
     def save(self, filename="output.txt"):
         with open(filename, "w") as f:
-            for line in self.code:
+            for line in self.lines():
                 f.write(line + "\n")
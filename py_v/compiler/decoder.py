@@ -0,0 +1,169 @@
+from utils.show_msg import show_error
+from helpers.validation import is_valid_var_name
+from compiler.program import Program
+from compiler.codegen import format_instruction
+from compiler.opcodes import (
+    OPCODE_IDS, BINARY_OPS, NO_OPERAND,
+    NOP, ASSIGN, NOT, UMINUS, JMP, JMPF,
+)
+
+RESERVED_NAMES = {'let', 'if', 'else', 'while', 'print', 'true', 'false', 'not', 'and', 'or'}
+
+
+def split_fields(content):
+    """Split the inside of a TAC tuple on commas that are not inside string literals."""
+    fields = []
+    start = 0
+    quote = None
+    i = 0
+    while i < len(content):
+        ch = content[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in ('"', "'"):
+            quote = ch
+        elif ch == ',':
+            fields.append(content[start:i].strip())
+            start = i + 1
+        i += 1
+    fields.append(content[start:].strip())
+    return fields
+
+
+def parse_line(line):
+    if not (line.startswith("(") and line.endswith(")")):
+        show_error("runtime", "interpreter", f"Invalid line format: {line}")
+    parts = split_fields(line[1:-1])
+    if len(parts) != 4:
+        show_error("runtime", "interpreter", f"Malformed line: {line}")
+    return parts  # op, arg1, arg2, result
+
+
+def parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return None
+
+
+def build_symbol_table(quads):
+    symbol_table = {}
+    next_address = 400
+    for quad in quads:
+        if quad is None:
+            continue
+        for token in quad[1:]:
+            if is_valid_var_name(token) and token not in symbol_table and token not in RESERVED_NAMES:
+                symbol_table[token] = str(next_address)
+                next_address += 1
+    return symbol_table
+
+
+def decode_constant(text):
+    """Return `(True, value)` when `text` is a literal, `(False, text)` otherwise."""
+    if text in ("true", "false"):
+        return True, 1 if text == "true" else 0
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in ('"', "'"):
+        return True, text[1:-1]
+    if text.startswith("#"):
+        value = parse_number(text[1:])
+        if value is not None:
+            return True, value
+        text = text[1:]
+    return False, text
+
+
+def decode_target(text, quad):
+    try:
+        return int(text) - 1
+    except ValueError:
+        show_error("runtime", "interpreter", f"Invalid jump target in line: {format_instruction(quad)}")
+
+
+def address_key(address):
+    return int(address) if address.isdigit() else float("inf")
+
+
+def parse_code(code):
+    """Accept TAC text lines or `(op, arg1, arg2, result)` tuples; blank lines become None."""
+    quads = []
+    for entry in code:
+        if isinstance(entry, str):
+            line = entry.strip()
+            quads.append(tuple(parse_line(line)) if line else None)
+        else:
+            quads.append(tuple(entry))
+    return quads
+
+
+def decode_program(code):
+    """
+    Turn TAC (text lines or `CodeGenerator.code` tuples) into a `Program`: every
+    line is parsed once, each address gets a register slot, every literal is
+    stored once in the constant pool and jumps carry 0-based instruction indexes,
+    so nothing is re-parsed while executing.
+    """
+    quads = parse_code(code)
+    symbol_table = build_symbol_table(quads)
+
+    written = {quad[3] for quad in quads if quad is not None and quad[0] not in ('jmp', 'jmpf', 'print')}
+    addresses = sorted(written | set(symbol_table.values()), key=address_key)
+    registers = {address: slot for slot, address in enumerate(addresses)}
+
+    constants = []
+    constant_slots = {}
+
+    def constant(value):
+        key = (type(value), value)
+        if key not in constant_slots:
+            constant_slots[key] = len(addresses) + len(constants)
+            constants.append(value)
+        return constant_slots[key]
+
+    def operand(text):
+        if text == '_':
+            return NO_OPERAND
+        is_literal, value = decode_constant(text)
+        if is_literal:
+            return constant(value)
+        if value in written:
+            return registers[value]
+        number = parse_number(value)
+        if number is not None:
+            return constant(number)
+        if value in symbol_table:
+            return registers[symbol_table[value]]
+        show_error("runtime", "interpreter", f"Unknown variable or temp: {value}")
+
+    code = []
+    for quad in quads:
+        if quad is None:
+            code.append((NOP, NO_OPERAND, NO_OPERAND, None))
+            continue
+
+        op, arg1, arg2, result = quad
+        opcode = OPCODE_IDS.get(op)
+        if opcode is None or opcode == NOP:
+            show_error("runtime", "interpreter", f"Unknown operation: {op}")
+
+        if opcode == ASSIGN:
+            source = arg2 if is_valid_var_name(arg1) and arg1 in symbol_table else arg1
+            code.append((opcode, operand(source), NO_OPERAND, registers[result]))
+        elif opcode in BINARY_OPS:
+            code.append((opcode, operand(arg1), operand(arg2), registers[result]))
+        elif opcode in (NOT, UMINUS):
+            code.append((opcode, operand(arg1), NO_OPERAND, registers[result]))
+        elif opcode == JMP:
+            code.append((opcode, NO_OPERAND, NO_OPERAND, decode_target(result, quad)))
+        elif opcode == JMPF:
+            code.append((opcode, operand(arg1), NO_OPERAND, decode_target(result, quad)))
+        else:
+            code.append((opcode, operand(arg1), NO_OPERAND, None))
+
+    return Program(code, constants, addresses, symbol_table, tac=quads)
@@ -1,148 +1,166 @@
+import operator
+from utils import trace
 from utils.colorize import colorize
 from utils.show_msg import show_error, show_warning
-from helpers.validation import is_valid_var_name
+from compiler.codegen import format_instruction
+from compiler.program import Program
+from compiler.decoder import decode_program
+from compiler.opcodes import OPCODE_IDS, NOP, ASSIGN, NOT, UMINUS, JMP, JMPF, PRINT
+
+
+def divide(lval, rval):
+    if rval == 0:
+        show_error("divbyzero", "interpreter", "Can't division number by zero!")
+    return lval / rval
+
+
+BINARY_FUNCTIONS = {
+    OPCODE_IDS['+']: operator.add,
+    OPCODE_IDS['-']: operator.sub,
+    OPCODE_IDS['*']: operator.mul,
+    OPCODE_IDS['/']: divide,
+    OPCODE_IDS['%']: operator.mod,
+    OPCODE_IDS['>']: lambda lval, rval: int(lval > rval),
+    OPCODE_IDS['<']: lambda lval, rval: int(lval < rval),
+    OPCODE_IDS['>=']: lambda lval, rval: int(lval >= rval),
+    OPCODE_IDS['<=']: lambda lval, rval: int(lval <= rval),
+    OPCODE_IDS['==']: lambda lval, rval: int(lval == rval),
+    OPCODE_IDS['!=']: lambda lval, rval: int(lval != rval),
+    OPCODE_IDS['and']: lambda lval, rval: int(bool(lval) and bool(rval)),
+    OPCODE_IDS['or']: lambda lval, rval: int(bool(lval) or bool(rval)),
+}
+
 
 class ThreeAddressInterpreter:
-    def __init__(self, code_lines):
-        self.code = code_lines
-        self.variables = {}
+    """
+    Executes a `Program`, or TAC lines / `CodeGenerator.code` tuples which are
+    decoded on `load()`. `stdout` is any object with a `write` method and receives
+    one line per `print`; without it output goes to the console with the colored
+    `Output:` label.
+    """
+    def __init__(self, code, stdout=None):
+        self.code = code
+        self.stdout = stdout
+        self.program = code if isinstance(code, Program) else None
+        self.memory = []
         self.symbol_table = {}
+        self.dispatch = []
         self.instruction_pointer = 0
 
-    def get_value(self, operand):
-        if operand == '_':
-            return None
-        if operand in ("true", "false"):
-            return 1 if operand == "true" else 0
-        if operand.startswith('"') and operand.endswith('"'):
-            return operand[1:-1]
-        if operand.startswith("'") and operand.endswith("'"):
-            return operand[1:-1]
-        if operand.startswith("#"):
-            operand = operand[1:]
-        
-        if str(operand) in self.variables:
-            val = self.variables[operand]
-            while isinstance(val, str) and val in self.variables:
-                val = self.variables[val]
-            return val
-            
-
-        if isinstance(operand, int) or isinstance(operand, float):
-            return operand
-
+    @property
+    def variables(self):
+        """Current register values keyed by TAC address."""
+        if self.program is None:
+            return {}
+        return dict(zip(self.program.addresses, self.memory))
+
+    def make_handlers(self):
+        """
+        Build one handler per opcode. A handler takes the decoded operands and the
+        current instruction index and returns the index of the next instruction.
+        """
+        memory = self.memory
+
+        def nop(arg1, arg2, result, ip):
+            return ip + 1
+
+        def assign(arg1, arg2, result, ip):
+            memory[result] = memory[arg1]
+            return ip + 1
+
+        def binary(fn):
+            def handler(arg1, arg2, result, ip):
+                memory[result] = fn(memory[arg1], memory[arg2])
+                return ip + 1
+            return handler
+
+        def not_(arg1, arg2, result, ip):
+            memory[result] = int(not memory[arg1])
+            return ip + 1
+
+        def uminus(arg1, arg2, result, ip):
+            memory[result] = -memory[arg1]
+            return ip + 1
+
+        def jmp(arg1, arg2, result, ip):
+            return result
+
+        def jmpf(arg1, arg2, result, ip):
+            return ip + 1 if memory[arg1] else result
+
+        if self.stdout is None:
+            def print_(arg1, arg2, result, ip):
+                print(f"{colorize('Output:', 'lightgreen')} {memory[arg1]}")
+                return ip + 1
+        else:
+            write = self.stdout.write
+
+            def print_(arg1, arg2, result, ip):
+                write(f"{memory[arg1]}\n")
+                return ip + 1
+
+        handlers = {NOP: nop, ASSIGN: assign, NOT: not_, UMINUS: uminus, JMP: jmp, JMPF: jmpf, PRINT: print_}
+        for opcode, fn in BINARY_FUNCTIONS.items():
+            handlers[opcode] = binary(fn)
+        return handlers
+
+    def jump_to_previous(self, jmp_handler):
+        """Wrap a jump whose target is the line right before it, which can never make progress."""
+        def handler(arg1, arg2, result, ip):
+            target = jmp_handler(arg1, arg2, result, ip)
+            if target == result:
+                show_warning("infiniteloop", "interpreter", f"jmp to same line {result + 1}")
+            return target
+        return handler
+
+    def load(self):
+        if self.program is None:
+            self.program = decode_program(self.code)
+        self.symbol_table = self.program.symbol_table
+        self.memory = self.program.new_memory()
+        handlers = self.make_handlers()
+        self.dispatch = []
+        for ip, (op, arg1, arg2, result) in enumerate(self.program.code):
+            handler = handlers[op]
+            if op in (JMP, JMPF) and result == ip - 1:
+                handler = self.jump_to_previous(handler)
+            self.dispatch.append((handler, arg1, arg2, result))
+
+    def trace_step(self):
+        line = format_instruction(self.program.tac[self.instruction_pointer])
+        ip_info = colorize(f"[IP={self.instruction_pointer + 1}]", 'lightblue')
+        trace.emit(f"\n{ip_info} {colorize(line, 'lightwhite')}")
+        trace.emit(f"{colorize('[symbol_table]', 'magenta')} {self.symbol_table}")
+        trace.emit(f"{colorize('[variables]', 'lightyellow')} {self.variables}")
+
+    def execute(self):
+        dispatch = self.dispatch
+        end = len(dispatch)
+        ip = self.instruction_pointer
         try:
-            return int(operand)
-        except (ValueError, TypeError):
-            try:
-                return float(operand)
-            except (ValueError, TypeError):
-                if operand in self.symbol_table:
-                    addr = self.symbol_table[operand]
-                    val = self.variables.get(addr, 0)
-                    while isinstance(val, str) and val in self.variables:
-                        val = self.variables[val]
-                    return val
-                else:
-                    show_error("runtime", "interpreter", f"Unknown variable or temp: {operand}")
-                
-    def eval_expr(self, left, op, right):
-        lval = self.get_value(left)
-        rval = self.get_value(right)
-        if op == '+': return lval + rval
-        if op == '-': return lval - rval
-        if op == '*': return lval * rval
-        if op == '/':
-            if rval == 0:
-                show_error("divbyzero", "interpreter", "Can't division number by zero!")
-            else:
-                return lval / rval
-        if op == '%': return lval % rval
-        if op == '>': return int(lval > rval)
-        if op == '<': return int(lval < rval)
-        if op == '>=': return int(lval >= rval)
-        if op == '<=': return int(lval <= rval)
-        if op == '==': return int(lval == rval)
-        if op == '!=': return int(lval != rval)
-        if op == 'and': return int(bool(lval) and bool(rval))
-        if op == 'or': return int(bool(lval) or bool(rval))
-        show_error("runtime", "interpreter", f"Unknown operator: {op}")
-
-    def parse_line(self, line):
-        if not (line.startswith("(") and line.endswith(")")):
-            show_error("runtime", "interpreter", f"Invalid line format: {line}")
-        content = line[1:-1]
-        parts = [p.strip() for p in content.split(",")]
-        if len(parts) != 4:
-            show_error("runtime", "interpreter", f"Malformed line: {line}")
-        return parts  # op, arg1, arg2, result
-
-    def preprocess_symbol_table(self):
-        next_address = 400
-        for line in self.code:
-            op, arg1, arg2, result = self.parse_line(line.strip())
-            for token in (arg1, arg2, result):
-                if is_valid_var_name(token) and token not in self.symbol_table and token not in {'let', 'if', 'else', 'while', 'print', 'true', 'false', 'not', 'and', 'or',}:
-                    self.symbol_table[token] = str(next_address)
-                    next_address += 1
+            while ip < end:
+                handler, arg1, arg2, result = dispatch[ip]
+                ip = handler(arg1, arg2, result, ip)
+        finally:
+            self.instruction_pointer = ip
+
+    def execute_traced(self):
+        program = self.program.code
+        dispatch = self.dispatch
+        while self.instruction_pointer < len(dispatch):
+            ip = self.instruction_pointer
+            op, arg1, arg2, result = program[ip]
+            if op != NOP:
+                self.trace_step()
+                if op == JMPF:
+                    cond = self.memory[arg1]
+                    trace.emit(f"{colorize('Condition Result:', 'lightcyan')} {'true' if cond == 1 else 'false'}")
+            handler, arg1, arg2, result = dispatch[ip]
+            self.instruction_pointer = handler(arg1, arg2, result, ip)
 
     def run(self):
-        self.preprocess_symbol_table()
-        previous_ip = -1
-
-        while self.instruction_pointer < len(self.code):
-            line = self.code[self.instruction_pointer].strip()
-            if not line:
-                if self.instruction_pointer == previous_ip:
-                    show_warning("infiniteloop", "interpreter", "IP didn't change in last step!")
-                previous_ip = self.instruction_pointer
-                self.instruction_pointer += 1
-                continue
-
-            op, arg1, arg2, result = self.parse_line(line)
-
-            ip_info = colorize(f"[IP={self.instruction_pointer + 1}]", 'lightblue')
-            print(f"\n{ip_info} {colorize(line, 'lightwhite')}")
-            print(f"{colorize('[symbol_table]', 'magenta')} {self.symbol_table}")
-            print(f"{colorize('[variables]', 'lightyellow')} {self.variables}")
-
-            if op == '=':
-                if is_valid_var_name(arg1) and arg1 in self.symbol_table:
-                    val = self.get_value(arg2)
-                else:
-                    val = self.get_value(arg1)
-                self.variables[result] = val
-
-            elif op in ('+', '-', '*', '/', '%', '>', '<', '>=', '<=', '==', '!=', 'and', 'or'):
-                self.variables[result] = self.eval_expr(arg1, op, arg2)
-
-            elif op == 'not':
-                self.variables[result] = int(not self.get_value(arg1))
-
-            elif op == 'uminus':
-                self.variables[result] = -self.get_value(arg1)
-
-            elif op == 'jmp':
-                target = int(result)
-                if target == self.instruction_pointer:
-                    show_warning("infiniteloop", "interpreter", f"jmp to same line {target}")
-                self.instruction_pointer = target - 1
-                continue
-
-            elif op == 'jmpf':
-                cond = self.get_value(arg1)
-                print(f"{colorize('Condition Result:', 'lightcyan')}", "true" if cond == 1 else "false")
-                target = int(result)
-                if not cond:
-                    if target == self.instruction_pointer:
-                        show_warning("infiniteloop", "interpreter", f"jmp to same line {target}")
-                    self.instruction_pointer = target - 1
-                    continue
-
-            elif op == 'print':
-                print(f"{colorize('Output:', 'lightgreen')} {self.get_value(arg1)}")
-
-            else:
-                show_error("runtime", "interpreter", f"Unknown operation: {op}")
-
-            self.instruction_pointer += 1
+        self.load()
+        if trace.enabled(trace.STEPS):
+            self.execute_traced()
+        else:
+            self.execute()
@@ -1,4 +1,5 @@
 import re
+from utils import trace
 from utils.colorize import colorize
 from utils.show_msg import show_error
 
@@ -56,15 +57,17 @@ def tokenize(code):
     pos = 0
     line = 1
     col = 1
+    tracing = trace.enabled(trace.TOKENS)
     while pos < len(code):
         match = get_token(code, pos)
         if not match:
             show_error("syntax", "lexer", f"Unexpected character at line {line} col {col}: {code[pos]}")
         type = match.lastgroup
         value = match.group()
-        print(colorize(f"value: {value}", "yellow"))
-        print(colorize(f"type: {type}", "cyan"))
-        print(colorize(f"................", "red"))
+        if tracing:
+            trace.emit(colorize(f"value: {value}", "yellow"))
+            trace.emit(colorize(f"type: {type}", "cyan"))
+            trace.emit(colorize(f"................", "red"))
 
         if type in {"SKIP", "COMMENT_BLOCK", "COMMENT"}:
             lines = value.count('\n')
@@ -83,6 +86,7 @@ def tokenize(code):
             col += len(value)
 
         pos = match.end()
-    print(colorize("________________________________Tokens________________________________", "magenta"))
-    print(tokens)
+    if tracing:
+        trace.emit(colorize("________________________________Tokens________________________________", "magenta"))
+        trace.emit(str(tokens))
     return tokens
\ No newline at end of file
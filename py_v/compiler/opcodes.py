@@ -0,0 +1,22 @@
+OPCODES = (
+    'nop',
+    '=',
+    '+', '-', '*', '/', '%',
+    '>', '<', '>=', '<=', '==', '!=',
+    'and', 'or',
+    'not', 'uminus',
+    'jmp', 'jmpf',
+    'print',
+)
+OPCODE_IDS = {op: i for i, op in enumerate(OPCODES)}
+
+NOP = OPCODE_IDS['nop']
+ASSIGN = OPCODE_IDS['=']
+NOT = OPCODE_IDS['not']
+UMINUS = OPCODE_IDS['uminus']
+JMP = OPCODE_IDS['jmp']
+JMPF = OPCODE_IDS['jmpf']
+PRINT = OPCODE_IDS['print']
+BINARY_OPS = frozenset(OPCODE_IDS[op] for op in ('+', '-', '*', '/', '%', '>', '<', '>=', '<=', '==', '!=', 'and', 'or'))
+
+NO_OPERAND = None
@@ -1,4 +1,5 @@
 from compiler.codegen import  CodeGenerator
+from utils import trace
 from utils.colorize import colorize, log_parse
 from utils.show_msg import show_error
 from helpers.validation import is_number, validate_braces, is_valid_var_name
@@ -15,7 +16,8 @@ class Parser:
 
     def eat(self, token_type):
         if self.current_token and self.current_token[0] == token_type:
-            print(f"{colorize('[match]', 'lightyellow')} {colorize(self.current_token, 'lightwhite')}")
+            if trace.level >= trace.PRODUCTIONS:
+                trace.emit(f"{colorize('[match]', 'lightyellow')} {colorize(self.current_token, 'lightwhite')}")
             self.prev_token = self.current_token
             self.pos += 1
             self.current_token = self.tokens[self.pos] if self.pos < len(self.tokens) else None
@@ -173,7 +175,7 @@ class Parser:
             self.codegen.emit('jmp', '_', '_', '___')
 
             else_line = self.codegen.current_line
-            self.codegen.code[jmpf_index] = f"(jmpf, {cond}, _, {else_line + 1})"
+            self.codegen.patch(jmpf_index, "jmpf", cond, "_", else_line + 1)
 
             self.eat('KEYWORD')
             self.eat('LBRACE')
@@ -181,10 +183,10 @@ class Parser:
             self.eat('RBRACE')
 
             end_line = self.codegen.current_line
-            self.codegen.code[jmp_index] = f"(jmp, _, _, {end_line + 1})"
+            self.codegen.patch(jmp_index, "jmp", "_", "_", end_line + 1)
         else:
             end_line = self.codegen.current_line
-            self.codegen.code[jmpf_index] = f"(jmpf, {cond}, _, {end_line + 1})"
+            self.codegen.patch(jmpf_index, "jmpf", cond, "_", end_line + 1)
         
 
     def while_stmt(self):
@@ -214,10 +216,10 @@ class Parser:
         self.codegen.emit("jmp", "_", "_", start_line + 1)
 
         end_line = self.codegen.current_line
-        self.codegen.code[jmpf_index] = f"(jmpf, {cond}, _, {end_line + 1})"
+        self.codegen.patch(jmpf_index, "jmpf", cond, "_", end_line + 1)
 
         for idx in break_indices:
-            self.codegen.code[idx] = f"(jmp, _, _, {end_line + 1})"
+            self.codegen.patch(idx, "jmp", "_", "_", end_line + 1)
 
         self.codegen.break_stack.pop()
         self.codegen.continue_stack.pop()
@@ -0,0 +1,73 @@
+from compiler.codegen import format_instruction
+from compiler.opcodes import OPCODES, NOP, ASSIGN, JMP, JMPF, PRINT
+
+
+def format_constant(value):
+    if isinstance(value, str):
+        quote = "'" if '"' in value else '"'
+        return f"{quote}{value}{quote}"
+    return f"#{value}"
+
+
+class Program:
+    """
+    Executable form of a TAC listing.
+
+    `code` holds `(opcode, arg1, arg2, result)` tuples whose operands are indexes
+    into one flat memory list: the first `len(addresses)` entries are registers
+    (`addresses[i]` is the TAC address kept in register `i`) and the constant
+    pool follows them. Store results are register indexes and jump results are
+    0-based instruction indexes, so reading any operand is a single list index.
+    `tac` holds the `(op, arg1, arg2, result)` tuples the program was decoded
+    from, or is rebuilt from `code` when the program was loaded from bytecode.
+    """
+    def __init__(self, code, constants, addresses, symbol_table, tac=None):
+        self.code = code
+        self.constants = constants
+        self.addresses = addresses
+        self.symbol_table = symbol_table
+        self._tac = tac
+        self.registers = {address: slot for slot, address in enumerate(addresses)}
+
+    @property
+    def tac(self):
+        if self._tac is None:
+            self._tac = self.disassemble()
+        return self._tac
+
+    def new_memory(self):
+        return [0] * len(self.addresses) + self.constants
+
+    def slot_of(self, address):
+        return self.registers.get(str(address))
+
+    def format_operand(self, index):
+        if index is None:
+            return "_"
+        if index < len(self.addresses):
+            return self.addresses[index]
+        return format_constant(self.constants[index - len(self.addresses)])
+
+    def disassemble(self):
+        """Rebuild `(op, arg1, arg2, result)` tuples in the textual TAC format."""
+        quads = []
+        for opcode, arg1, arg2, result in self.code:
+            if opcode == NOP:
+                quads.append(None)
+            elif opcode in (JMP, JMPF):
+                quads.append((OPCODES[opcode], self.format_operand(arg1), "_", str(result + 1)))
+            elif opcode == PRINT:
+                quads.append((OPCODES[opcode], self.format_operand(arg1), "_", "_"))
+            elif opcode == ASSIGN:
+                quads.append((OPCODES[opcode], self.format_operand(arg1), "_", self.addresses[result]))
+            else:
+                quads.append((OPCODES[opcode], self.format_operand(arg1), self.format_operand(arg2), self.addresses[result]))
+        return quads
+
+    def tac_lines(self):
+        return [format_instruction(quad) if quad else "" for quad in self.tac]
+
+    def save_tac(self, filename):
+        with open(filename, "w") as f:
+            for line in self.tac_lines():
+                f.write(line + "\n")
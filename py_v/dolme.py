@@ -0,0 +1,62 @@
+"""
+Library entry points for compiling and running Dolme programs in memory.
+
+    import dolme
+    program = dolme.compile('let x = 2; print(x * 3);')
+    dolme.run(program, stdout=sys.stdout)
+"""
+from compiler.lexer import tokenize
+from compiler.parser import Parser
+from compiler.decoder import decode_program
+from compiler import bytecode
+from compiler.interpreter import ThreeAddressInterpreter
+from utils import trace
+from utils.colorize import colorize
+
+
+def compile(source, tac_path=None):
+    """
+    Compile Dolme source text to a `Program`. The TAC is handed to the decoder as
+    tuples; `tac_path` additionally writes the textual listing to that file.
+    """
+    if trace.enabled(trace.PHASES):
+        trace.emit(colorize("----------------------------Lexer--------------------------------", "lightblue"))
+    tokens = tokenize(source)
+
+    if trace.enabled(trace.PHASES):
+        trace.emit(colorize("----------------------------Parser-------------------------------", "lightgreen"))
+    parser = Parser(tokens)
+    parser.parse()
+
+    program = decode_program(parser.codegen.code)
+    if tac_path is not None:
+        program.save_tac(tac_path)
+    return program
+
+
+def compile_file(path, tac_path=None):
+    with open(path, "r") as f:
+        return compile(f.read(), tac_path=tac_path)
+
+
+def load(path, tac_path=None):
+    """Return a `Program` from either a .dlmc bytecode file or Dolme source."""
+    if bytecode.is_bytecode(path):
+        return bytecode.load(path)
+    return compile_file(path, tac_path=tac_path)
+
+
+def save_bytecode(program, path):
+    bytecode.dump(program, path)
+
+
+def run(program, stdout=None):
+    """
+    Execute a compiled `Program` and return the finished interpreter. `stdout`
+    receives one line per `print`; see `ThreeAddressInterpreter`.
+    """
+    if trace.enabled(trace.PHASES):
+        trace.emit(colorize("---------------------------Interpreter---------------------------", "lightcyan"))
+    interpreter = ThreeAddressInterpreter(program, stdout=stdout)
+    interpreter.run()
+    return interpreter
@@ -1,23 +1,32 @@
-from compiler.lexer import tokenize
-from compiler.parser import Parser
-from compiler.interpreter import ThreeAddressInterpreter
-from utils.colorize import colorize
+import argparse
+import atexit
+import os
+import dolme
+from utils import trace
 
-with open("./py_v/input.txt", "r") as f:
-    code = f.read()
+base_dir = os.path.dirname(os.path.abspath(__file__))
 
-print(colorize("----------------------------Lexer--------------------------------", "lightblue"))
-tokens = tokenize(code)
+arg_parser = argparse.ArgumentParser(description="Compile and run a Dolme program")
+arg_parser.add_argument("source", nargs="?", default=os.path.join(base_dir, "input.txt"), help="Dolme source file or .dlmc bytecode")
+arg_parser.add_argument("--tac", default=os.path.join(base_dir, "output.txt"), help="where to write the three-address code")
+arg_parser.add_argument("--dlmc", help="also write the compiled program as .dlmc bytecode")
+arg_parser.add_argument("--disassemble", action="store_true", help="print the three-address code instead of running it")
+arg_parser.add_argument("--trace", choices=list(trace.LEVELS), default="steps", help="how much compiler/interpreter activity to print")
+arg_parser.add_argument("--trace-file", metavar="FILE", help="write the trace to FILE instead of the terminal")
+args = arg_parser.parse_args()
+trace.set_level(args.trace)
+if args.trace_file:
+    trace_file = open(args.trace_file, "w")
+    # closed (and flushed) however the run ends, including on a Dolme error
+    atexit.register(trace_file.close)
+    trace.set_sinks(trace.stream_sink(trace_file))
 
-print(colorize("----------------------------Parser-------------------------------", "lightgreen"))
-parser = Parser(tokens)
-parser.parse()
-parser.codegen.save("./py_v/output.txt")
+program = dolme.load(args.source, tac_path=args.tac)
 
-with open("./py_v/output.txt", "r") as f:
-    tac_code = f.readlines()
-    
-print(colorize("---------------------------Interpreter---------------------------", "lightcyan"))
-interpreter = ThreeAddressInterpreter(tac_code)
-interpreter.run()
+if args.dlmc:
+    dolme.save_bytecode(program, args.dlmc)
 
+if args.disassemble:
+    print("\n".join(program.tac_lines()))
+else:
+    dolme.run(program)
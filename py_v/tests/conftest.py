@@ -0,0 +1,31 @@
+import io
+import os
+import sys
+
+# the compiler modules import each other as `compiler.x` and `utils.x` from py_v
+PY_V = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PY_V)
+sys.path.insert(0, os.path.join(PY_V, "bench"))
+
+import dolme
+from utils import trace
+
+trace.set_level(trace.OFF)
+
+
+def error_of(error):
+    return None if error is None else (type(error).__name__, str(error))
+
+
+def outcome(action):
+    """What `action(stdout)` printed and the type and message of the error it raised, if any."""
+    stdout = io.StringIO()
+    try:
+        action(stdout)
+    except Exception as error:
+        return stdout.getvalue(), error_of(error)
+    return stdout.getvalue(), None
+
+
+def run_outcome(program):
+    return outcome(lambda stdout: dolme.run(program, stdout=stdout))
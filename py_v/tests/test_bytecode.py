@@ -0,0 +1,53 @@
+import mmap
+import pytest
+import dolme
+from compiler import bytecode
+from conftest import run_outcome
+
+SOURCE = 'let x = 3; let big = 123456789012345678901234567890; let s = "a\'b";\nwhile (x > 0) { print(x * 1.5); x = x - 1; }\nprint(big); print(s);\n'
+
+
+@pytest.fixture
+def program():
+    return dolme.compile(SOURCE)
+
+
+def test_round_trip(program):
+    loaded = bytecode.loads(bytecode.dumps(program))
+    assert loaded.code == program.code
+    assert loaded.constants == program.constants
+    assert loaded.addresses == program.addresses
+    assert loaded.symbol_table == program.symbol_table
+    assert run_outcome(loaded) == run_outcome(program)
+
+
+def test_load_file_and_mmap(program, tmp_path):
+    path = tmp_path / "program.dlmc"
+    bytecode.dump(program, path)
+    assert bytecode.is_bytecode(path)
+    assert bytecode.load(path).code == program.code
+    assert dolme.load(str(path)).code == program.code
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert bytecode.loads(mapped).constants == program.constants
+
+
+def test_disassemble_rebuilds_the_tac(program):
+    loaded = bytecode.loads(bytecode.dumps(program))
+    assert loaded.tac_lines() == program.tac_lines()
+
+
+def test_source_is_not_bytecode(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(SOURCE)
+    assert not bytecode.is_bytecode(path)
+
+
+@pytest.mark.parametrize("corrupt, message", [
+    (lambda data: data[:10], "truncated"),
+    (lambda data: data[:-1], "truncated"),
+    (lambda data: b"XXXX" + data[4:], "Not a Dolme bytecode file"),
+    (lambda data: data[:4] + (bytecode.VERSION + 1).to_bytes(2, "little") + data[6:], "Unsupported bytecode version"),
+])
+def test_corrupt_input_is_rejected(program, corrupt, message):
+    with pytest.raises(RuntimeError, match=message):
+        bytecode.loads(corrupt(bytecode.dumps(program)))
@@ -0,0 +1,61 @@
+"""
+Differential tests: every way of compiling and running a program has to print
+the same output and stop with the same error as the plain interpreter on the
+unoptimized TAC.
+"""
+import os
+import pytest
+import dolme
+from compiler import bytecode
+from conftest import PY_V, run_outcome
+
+with open(os.path.join(PY_V, "input.txt")) as f:
+    INPUT_TXT = f.read()
+
+PROGRAMS = {
+    "input_txt": INPUT_TXT,
+    "literal_conditions": (
+        'if (true) { print(1); } if (false) { print(2); } if (not true) { print(3); }\n'
+        'if (not false) { print(4); } if (1) { print(5); } if (0) { print(6); } if ("s") { print(7); }\n'
+        'let i = 0; while (true) { i = i + 1; if (i > 3) { break; } } print(i);\n'
+    ),
+    "booleans": (
+        "let a = 1; let b = 0; if (a and b) { print(1); } if (a or b) { print(2); } if (not b) { print(3); }\n"
+        "while (a < 5 and not (a == 3)) { a = a + 1; print(a); }\n"
+    ),
+    "break_continue": (
+        "let i = 0; let total = 0;\n"
+        "while (i < 20) { i = i + 1; if (i % 3 == 0) { continue; } if (i > 16) { break; } total = total + i; }\n"
+        "print(total); print(i);\n"
+    ),
+    "arithmetic": "let x = 7; let y = 2; print(x / y); print(x % y); print(-x * y); print(x - -y); print(1.5 * 4);",
+    "strings": (
+        'let s = ""; let i = 0; while (i < 50) { s = s + "ab"; i = i + 1; }\n'
+        'let t = s + "!"; let u = s + "?"; print(t); print(u); print(s * 2);\n'
+        'if (t != u) { print(1); } if (s < t) { print(2); } if (s + "!" == t) { print(3); }\n'
+        'let f = "n=%d" + ""; print(f % 4);\n'
+    ),
+    "division_by_zero": "let x = 1; print(x); let y = 0; print(x / y);",
+    "string_plus_number": 'let s = "a" + "b"; print(s); print(s + 1);',
+    "number_less_than_string": 'let s = "a" + "b"; if (1 < s) { print(1); }',
+    "unary_minus_string": 'let s = "a" + "b"; print(-s);',
+    "empty_loop": "while (true) { }",
+    "empty_loop_after_code": "let x = 1; print(x); while (x == 1) { print(x); while (true) { } }",
+}
+
+
+@pytest.mark.parametrize("name", sorted(PROGRAMS))
+def test_engines_agree(name):
+    source = PROGRAMS[name]
+    program = dolme.compile(source)
+    interpreted = run_outcome(program)
+
+    loaded = bytecode.loads(bytecode.dumps(program))
+    assert loaded.tac_lines() == program.tac_lines()
+    assert run_outcome(loaded) == interpreted
+
+
+def test_empty_loop_is_reported():
+    output, error = run_outcome(dolme.compile(PROGRAMS["empty_loop_after_code"]))
+    assert output.splitlines() == ["1", "1"]
+    assert error[0] == "RuntimeWarning" and "jmp to same line" in error[1]
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+import pytest
+from utils import trace
+import dolme
+from conftest import PY_V
+
+PROGRAM = "let i = 0;\nwhile (i < 3) {\n    print(i);\n    i = i + 1;\n}\n"
+
+
+@pytest.fixture
+def messages():
+    """Every message traced during the test."""
+    emitted = []
+    trace.set_sinks(emitted.append)
+    yield emitted
+    trace.set_sinks(trace.stdout_sink)
+    trace.set_level(trace.OFF)
+
+
+def steps(lines):
+    return sum("[IP=" in line for line in lines)
+
+
+def test_levels():
+    trace.set_level("tokens")
+    assert trace.enabled(trace.PHASES) and trace.enabled(trace.TOKENS)
+    assert not trace.enabled(trace.PRODUCTIONS)
+    trace.set_level(trace.OFF)
+    assert not trace.enabled(trace.PHASES)
+    with pytest.raises(ValueError):
+        trace.set_level("everything")
+
+
+def test_off_traces_nothing(messages, capsys):
+    dolme.run(dolme.compile(PROGRAM))
+    assert messages == []
+    assert capsys.readouterr().out.count("Output:") == 3
+
+
+@pytest.mark.parametrize("level, expected, hidden", [
+    ("tokens", "value: while", "[parse]"),
+    ("productions", "[parse]", "[IP="),
+    ("steps", "[IP=", None),
+])
+def test_each_level_adds_its_messages(messages, level, expected, hidden):
+    trace.set_level(level)
+    dolme.run(dolme.compile(PROGRAM))
+    text = "\n".join(messages)
+    assert expected in text
+    if hidden is not None:
+        assert hidden not in text
+
+
+def test_every_sink_gets_every_message():
+    first, second = [], []
+    trace.set_sinks(first.append, second.append)
+    try:
+        trace.emit("one")
+        trace.emit("two")
+    finally:
+        trace.set_sinks(trace.stdout_sink)
+    assert first == second == ["one", "two"]
+
+
+def run_main(tmp_path, source, *args):
+    source_path = tmp_path / "input.txt"
+    source_path.write_text(source)
+    command = [sys.executable, os.path.join(PY_V, "main.py"), str(source_path), "--tac", str(tmp_path / "output.txt"), *args]
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def test_trace_file_gets_the_whole_trace(tmp_path, messages):
+    trace_path = tmp_path / "trace.txt"
+    result = run_main(tmp_path, PROGRAM, "--trace", "steps", "--trace-file", str(trace_path))
+    assert result.returncode == 0
+    assert "[IP=" not in result.stdout and result.stdout.count("Output:") == 3
+
+    trace.set_level(trace.STEPS)
+    dolme.run(dolme.compile(PROGRAM))
+    assert steps(trace_path.read_text().splitlines()) == steps(messages)
+
+
+def test_trace_file_is_written_when_the_program_fails(tmp_path):
+    trace_path = tmp_path / "trace.txt"
+    result = run_main(tmp_path, "let x = 0;\nprint(1 / x);\n", "--trace", "steps", "--trace-file", str(trace_path))
+    assert result.returncode != 0
+    # the division that failed is the last step traced
+    assert steps(trace_path.read_text().splitlines()) == 2
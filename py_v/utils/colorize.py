@@ -1,3 +1,5 @@
+from utils import trace
+
 def colorize(text, color):
     colors = {
         'black': '\033[30m',
@@ -21,4 +23,5 @@ def colorize(text, color):
     return f"{colors.get(color, colors['white'])}{text}{colors['reset']}"
 
 def log_parse(msg):
-    print(f"{colorize('[parse]', 'lightblue')} {msg}")
\ No newline at end of file
+    if trace.level >= trace.PRODUCTIONS:
+        trace.emit(f"{colorize('[parse]', 'lightblue')} {msg}")
\ No newline at end of file
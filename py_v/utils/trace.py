@@ -0,0 +1,51 @@
+import sys
+
+OFF, PHASES, TOKENS, PRODUCTIONS, STEPS = range(5)
+
+LEVELS = {
+    'off': OFF,
+    'phases': PHASES,           # banner per compiler phase
+    'tokens': TOKENS,           # every token produced by the lexer
+    'productions': PRODUCTIONS, # every grammar production and matched token
+    'steps': STEPS,             # every instruction executed by the interpreter
+}
+
+# Call sites check `enabled(<LEVEL>)` before building any message, so a disabled
+# level costs no formatting; the per-token paths of the parser compare
+# `trace.level >= <LEVEL>` inline to save the call.
+level = OFF
+
+
+def stdout_sink(msg):
+    sys.stdout.write(f"{msg}\n")
+
+
+def stream_sink(stream):
+    def sink(msg):
+        stream.write(f"{msg}\n")
+    return sink
+
+
+sinks = [stdout_sink]
+
+
+def set_level(new_level):
+    global level
+    if isinstance(new_level, str):
+        if new_level not in LEVELS:
+            raise ValueError(f"Unknown trace level '{new_level}', expected one of: {', '.join(LEVELS)}")
+        new_level = LEVELS[new_level]
+    level = new_level
+
+
+def enabled(at_level):
+    return level >= at_level
+
+
+def set_sinks(*new_sinks):
+    sinks[:] = new_sinks
+
+
+def emit(msg):
+    for sink in sinks:
+        sink(msg)